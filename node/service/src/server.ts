@@ -59,6 +59,28 @@ const adapters = new Map<string, ProviderAdapter>([
   ['xai', xaiAdapter],
 ])
 
+// Limits for /execute_batch: the most calls one request may carry, and how many
+// of them run at once, so a single batch can't flood an MCP server
+const MAX_BATCH_CALLS = 100
+const BATCH_CONCURRENCY = 8
+
+/**
+ * Map items through an async function with at most `limit` in flight,
+ * preserving input order in the results.
+ */
+async function mapWithConcurrency<T, R>(items: T[], limit: number, fn: (item: T) => Promise<R>): Promise<R[]> {
+  const results = new Array<R>(items.length)
+  let next = 0
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++
+      results[index] = await fn(items[index])
+    }
+  }
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker))
+  return results
+}
+
 function parseTool(server: string | undefined, tool: string): { server: string, tool: string } {
   if (tool.startsWith('mcp__')) {
     const parts = tool.split('__')
@@ -349,6 +371,85 @@ app.post('/execute', async (req, res) => {
   }
 })
 
+app.post('/execute_batch', async (req, res) => {
+  const startTime = Date.now()
+  const { provider, calls, server } = req.body ?? {}
+
+  // Validate request
+  if (!provider || typeof provider !== 'string') {
+    logger.warn('Invalid execute_batch request: missing provider')
+    return res.status(400).json({ error: 'Missing or invalid "provider" field' })
+  }
+
+  if (!Array.isArray(calls)) {
+    logger.warn('Invalid execute_batch request: missing calls', { provider })
+    return res.status(400).json({ error: 'Missing or invalid "calls" field' })
+  }
+
+  if (calls.length > MAX_BATCH_CALLS) {
+    logger.warn('Invalid execute_batch request: too many calls', { provider, count: calls.length })
+    return res.status(400).json({ error: `Too many calls: ${calls.length} (max ${MAX_BATCH_CALLS})` })
+  }
+
+  const adapter = adapters.get(provider)
+  if (!adapter) {
+    logger.warn('Unknown provider', { provider })
+    return res.status(400).json({
+      error: `Unknown provider: ${provider}`,
+      availableProviders: Array.from(adapters.keys())
+    })
+  }
+
+  const serverName = server ?? 'default'
+
+  // Reject an unknown or unreachable server once, like /execute, rather than
+  // as the same error for every call
+  try {
+    await manager.ensure(serverName)
+  } catch (error: any) {
+    logger.error('Execute batch failed', {
+      provider,
+      server,
+      error: String(error?.message ?? error),
+    })
+    const statusCode = getErrorStatusCode(error)
+    return res.status(statusCode).json({ error: String(error?.message ?? error) })
+  }
+
+  // Calls in a batch are independent (e.g. parallel tool_calls from one model
+  // response), so run them concurrently and report failures per call
+  const results = await mapWithConcurrency(calls, BATCH_CONCURRENCY, async (call: any) => {
+    const callStart = Date.now()
+    try {
+      if (!call || typeof call !== 'object') {
+        throw new Error('Missing or invalid call')
+      }
+      const mcpCall = adapter.translateInvocation(call)
+      const mcpResult = await manager.callTool(serverName, mcpCall.name, mcpCall.arguments)
+
+      logger.logToolExecution(mcpCall.name, serverName, Date.now() - callStart, true, { provider })
+      return { result: adapter.formatResult(mcpResult) }
+    } catch (error: any) {
+      logger.error('Execute failed', {
+        provider,
+        server,
+        tool: call?.name,
+        duration: Date.now() - callStart,
+        error: String(error?.message ?? error),
+      })
+      return { error: String(error?.message ?? error) }
+    }
+  })
+
+  logger.info('Executed tool batch', {
+    provider,
+    server: serverName,
+    count: calls.length,
+    duration: Date.now() - startTime,
+  })
+  res.json({ results })
+})
+
 export { app }
 
 if (process.env.NODE_ENV !== 'test') {
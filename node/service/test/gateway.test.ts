@@ -131,6 +131,58 @@ describe('gateway endpoints', () => {
     expect(res.body.availableProviders).toContain('gemini')
   })
 
+  it('can execute several tools via /execute_batch', async () => {
+    const res = await request(server)
+      .post('/execute_batch')
+      .send({
+        provider: 'gemini',
+        calls: [
+          { name: 'add', args: { a: 15, b: 27 } },
+          { name: 'multiply', args: { a: 6, b: 7 } },
+          { args: {} },
+        ],
+        server: 'default',
+      })
+    expect(res.status).toBe(200)
+    expect(res.body.results).toHaveLength(3)
+    expect(res.body.results[0].result).toBeTruthy()
+    expect(res.body.results[1].result).toBeTruthy()
+    expect(res.body.results[2].error).toContain('name')
+  })
+
+  it('rejects /execute_batch with missing calls', async () => {
+    const res = await request(server)
+      .post('/execute_batch')
+      .send({
+        provider: 'gemini',
+      })
+    expect(res.status).toBe(400)
+    expect(res.body.error).toContain('calls')
+  })
+
+  it('rejects /execute_batch with too many calls', async () => {
+    const res = await request(server)
+      .post('/execute_batch')
+      .send({
+        provider: 'gemini',
+        calls: Array.from({ length: 101 }, () => ({ name: 'add', args: { a: 1, b: 2 } })),
+      })
+    expect(res.status).toBe(400)
+    expect(res.body.error).toContain('Too many calls')
+  })
+
+  it('rejects /execute_batch for an unknown server', async () => {
+    const res = await request(server)
+      .post('/execute_batch')
+      .send({
+        provider: 'gemini',
+        calls: [{ name: 'add', args: { a: 1, b: 2 } }],
+        server: 'no-such-server',
+      })
+    expect(res.status).toBe(400)
+    expect(res.body.error).toContain('Unknown server')
+  })
+
   it('supports multi-step workflow via key-value tools', async () => {
     // Store a value
     const store = await request(server)
@@ -54,20 +54,282 @@ Example usage with OpenAI:
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import http.client
+import io
 import json
+import random
+import socket
+import sys
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Literal, Mapping, Optional
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Literal, Mapping, Optional, Sequence
 import urllib.request
 import urllib.error
+from urllib.parse import unquote, urlencode, urlsplit
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import urllib3
+except ImportError:  # pragma: no cover - optional dependency
+    urllib3 = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
 
 # Type aliases for better documentation
 Provider = Literal["gemini", "openai", "xai"]
 ToolSchema = dict[str, Any]
 ExecutionResult = Any
 
+# JSON codec working directly on bytes: orjson when installed, stdlib otherwise
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _loads = json.loads
+
+# Responses up to this size are read into a reusable per-thread buffer
+_RECV_BUF_MAX = 1 << 20
+_recv_local = threading.local()
+
+# Request headers, shared rather than rebuilt per call (never mutate these)
+_GET_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+_JSON_HEADERS = {**_GET_HEADERS, "Content-Type": "application/json"}
+
+# Connections kept alive per pool; extra concurrent requests open (and then
+# discard) short-lived sockets instead of blocking.
+_POOL_MAXSIZE = 10
+
+# Options for pooled sockets: disable Nagle so small request/response turnarounds
+# don't wait on delayed ACKs, and enlarge the receive buffer for big results/logs
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, 256 * 1024),
+]
+
+_NETWORK_ERRORS: tuple[type[BaseException], ...] = (urllib.error.URLError, OSError, TimeoutError)
+if urllib3 is not None:
+    _NETWORK_ERRORS += (urllib3.exceptions.HTTPError,)
+if httpx is not None:
+    _NETWORK_ERRORS += (httpx.TransportError,)
+
+# Timeouts while waiting for a response, i.e. after the request was sent. The
+# gateway may still be running the call, so non-idempotent requests aren't retried.
+# (urllib wraps connect/send timeouts in URLError, which is not a socket.timeout.)
+_READ_TIMEOUT_ERRORS: tuple[type[BaseException], ...] = (socket.timeout,)
+if urllib3 is not None:
+    _READ_TIMEOUT_ERRORS += (urllib3.exceptions.ReadTimeoutError,)
+if httpx is not None:
+    _READ_TIMEOUT_ERRORS += (httpx.ReadTimeout,)
+
+
+# Most calls the gateway accepts in one /execute_batch request
+_MAX_BATCH_CALLS = 100
+
+# Slotted dataclasses (3.10+) avoid a per-instance __dict__ and speed up attribute access
+_DATACLASS_OPTIONS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Returned by _make_request for a 304 Not Modified response
+_NOT_MODIFIED = object()
+
+
+def _url(base: str, **params: Any) -> str:
+    """Append URL-encoded query parameters to ``base``, skipping unset ones.
+
+    ``None`` and empty strings are left out, so e.g. ``server=""`` falls back to
+    the gateway's default server rather than naming a server ``""``.
+    """
+    query = {k: v for k, v in params.items() if v is not None and v != ""}
+    return f"{base}?{urlencode(query)}" if query else base
+
+
+def _proxy_for(url: str) -> Optional[str]:
+    """Return the proxy ``urlopen`` would use for ``url``, or None to connect directly.
+
+    Honours ``HTTP(S)_PROXY``/``NO_PROXY`` (and platform proxy settings) the way
+    urllib's ``ProxyHandler`` does. The pooled transports don't read these
+    themselves, so they are configured with the result explicitly.
+    """
+    parts = urlsplit(url)
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.netloc.rpartition("@")[2]):
+        return None
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _pool_manager(base_url: str, **kwargs: Any) -> Any:
+    """Build the urllib3 pool for ``base_url``, routed through its proxy if one applies."""
+    proxy = _proxy_for(base_url)
+    if proxy is None:
+        return urllib3.PoolManager(**kwargs)
+
+    # Like ProxyHandler, take proxy credentials from the URL
+    parts = urlsplit(proxy)
+    proxy_headers = None
+    if parts.username is not None:
+        proxy_headers = urllib3.util.make_headers(
+            proxy_basic_auth=f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        )
+        proxy = parts._replace(netloc=parts.netloc.rpartition("@")[2]).geturl()
+    return urllib3.ProxyManager(proxy, proxy_headers=proxy_headers, **kwargs)
+
+
+def _decode_arguments(call: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Decode an OpenAI/xAI call's JSON-string ``arguments`` into an object.
+
+    The gateway accepts either form; sending the object avoids re-escaping the
+    string inside the request body and a second parse on the gateway. Invalid
+    JSON is passed through unchanged so the gateway reports it as before.
+    """
+    arguments = call.get("arguments")
+    if not isinstance(arguments, str):
+        return call
+    try:
+        return {**call, "arguments": _loads(arguments)}
+    except ValueError:
+        return call
+
+
+def _backoff(retry_delay: float, retry_backoff: float, retry_cap: float, attempt: int) -> float:
+    """Pick a jittered delay before retry number ``attempt + 1``.
+
+    The upper bound grows exponentially up to ``retry_cap``, starting one step
+    above ``retry_delay`` so even the first retry is jittered; sampling uniformly
+    below it keeps clients that failed together from retrying in lockstep.
+    """
+    return random.uniform(
+        retry_delay, min(retry_delay * retry_backoff ** (attempt + 1), retry_cap)
+    )
+
+
+def _decompress(body: bytes, encoding: Any) -> bytes:
+    """Undo a gzip or deflate Content-Encoding (urllib doesn't do this itself)."""
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate data without the zlib wrapper
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _read_into_buffer(resp: Any, length: int) -> memoryview:
+    """Read exactly ``length`` bytes of ``resp`` into this thread's reusable buffer.
+
+    The returned view is only valid until the next call on the same thread.
+    """
+    buf = getattr(_recv_local, "buf", None)
+    if buf is None or len(buf) < length:
+        buf = _recv_local.buf = bytearray(max(length, 16384))
+
+    view = memoryview(buf)[:length]
+    pos = 0
+    while pos < length:
+        n = resp.readinto(view[pos:])
+        if not n:
+            raise http.client.IncompleteRead(bytes(view[:pos]), length - pos)
+        pos += n
+    return view
+
+
+class _GzipResponse(gzip.GzipFile):
+    """Decompressing reader over a streamed response that also closes the response."""
+
+    def __init__(self, resp: Any) -> None:
+        super().__init__(fileobj=resp)
+        self._resp = resp
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._resp.close()
+
+
+class _ByteStreamReader(io.RawIOBase):
+    """Readable file over a streamed httpx response that also closes the response.
+
+    Lets incremental parsers such as ijson consume the (decoded) body chunk by
+    chunk instead of from a fully buffered copy.
+    """
 
-@dataclass
+    def __init__(self, resp: Any) -> None:
+        super().__init__()
+        self._resp = resp
+        self._chunks = resp.iter_bytes()
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        n = min(len(b), len(self._pending))
+        b[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
+
+    def close(self) -> None:
+        try:
+            self._resp.close()
+        finally:
+            super().close()
+
+
+class _HTTPStatusError(RuntimeError):
+    """RuntimeError for an HTTP error response, carrying its status code."""
+
+    def __init__(self, message: str, status: int) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _http_error(status: int, reason: str, raw: bytes) -> RuntimeError:
+    """Build the error for an HTTP error response, preferring the body's "error" field."""
+    if not raw:
+        msg = reason
+    else:
+        try:
+            msg = _loads(raw).get("error")
+        except Exception:
+            msg = None
+        if not msg:
+            # Not a JSON error object: fall back to the raw body text
+            msg = raw.decode('utf-8', errors='replace')
+
+    return _HTTPStatusError(f"Gateway HTTP {status}: {msg}", status)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class GatewayClient:
     """Client for interacting with the MCP Tool Gateway HTTP API.
 
@@ -81,11 +343,25 @@ class GatewayClient:
         max_retries: Maximum number of retry attempts for failed requests (default: 3)
         retry_delay: Initial delay between retries in seconds (default: 1.0)
         retry_backoff: Exponential backoff multiplier for retries (default: 2.0)
+        retry_cap: Upper bound on the delay between retries in seconds (default: 30.0)
+        keep_alive: Reuse pooled keep-alive connections when urllib3 is installed
+            (default: True). Without urllib3, every request opens a new connection.
+            Proxies from ``HTTP(S)_PROXY``/``NO_PROXY`` apply either way.
+        http2: Send requests over HTTP/2 with httpx so concurrent calls share one
+            multiplexed connection (default: False). Requires `httpx[http2]` and a
+            gateway reachable over TLS through an HTTP/2-capable proxy.
+
+    Attributes can be changed after construction; the next request picks up the
+    new values, rebuilding the connection pool if needed.
 
     Example:
         >>> client = GatewayClient("http://localhost:8787", timeout=30.0, max_retries=5)
         >>> tools = client.get_tools("gemini")
         >>> result = client.execute("gemini", {"name": "add", "args": {"a": 1, "b": 2}})
+
+        >>> # Close pooled connections when done
+        >>> with GatewayClient("http://localhost:8787") as client:
+        ...     status = client.health()
     """
 
     base_url: str
@@ -93,73 +369,256 @@ class GatewayClient:
     max_retries: int = 3
     retry_delay: float = 1.0
     retry_backoff: float = 2.0
+    retry_cap: float = 30.0
+    keep_alive: bool = True
+    http2: bool = False
+    _session: Any = field(default=None, init=False, repr=False, compare=False)
+    _schema_cache: dict[str, tuple[str, Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _session_config: Optional[tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _batch_supported: bool = field(default=True, init=False, repr=False, compare=False)
+    _healthy: bool = field(default=False, init=False, repr=False, compare=False)
+    _health_checked_at: float = field(
+        default=float("-inf"), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._open_session()
+
+    def _open_session(self) -> None:
+        """Build the transport for the current `base_url`, `http2` and `keep_alive`."""
+        self._session = None
+        if self.http2:
+            if httpx is None:
+                raise ImportError(
+                    "http2=True requires httpx: pip install mcp-tool-gateway[async]"
+                )
+            # A custom transport turns off httpx's own environment proxy
+            # lookup, so pass the proxy explicitly
+            proxy = _proxy_for(self.base_url)
+            self._session = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=_POOL_MAXSIZE),
+                    socket_options=_SOCKET_OPTIONS,
+                    proxy=httpx.Proxy(proxy) if proxy else None,
+                ),
+            )
+        elif self.keep_alive and urllib3 is not None:
+            self._session = _pool_manager(
+                self.base_url,
+                num_pools=1,
+                maxsize=_POOL_MAXSIZE,
+                block=False,
+                headers={"Connection": "keep-alive"},
+                socket_options=_SOCKET_OPTIONS,
+            )
+        self._session_config = (self.base_url, self.http2, self.keep_alive)
+
+    def __enter__(self) -> GatewayClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled keep-alive connections.
+
+        The client stays usable; a later request opens new connections.
+        """
+        session, config = self._session, self._session_config
+        self._session = None
+        self._session_config = None
+        if session is None:
+            return
+        if config is not None and config[1]:
+            session.close()  # httpx.Client
+        else:
+            session.clear()  # urllib3.PoolManager
+
+    def _send(
+        self,
+        url: str,
+        data: Optional[bytes],
+        method: str,
+        headers: dict[str, str],
+        stream: bool = False
+    ) -> tuple[int, str, Mapping[str, str], Any]:
+        """Send a single HTTP request without retrying.
+
+        Uses the pooled httpx (HTTP/2) or urllib3 session when available,
+        otherwise a one-shot urllib request.
+
+        Returns:
+            A ``(status, reason, headers, body)`` tuple. HTTP error statuses are returned
+            rather than raised; network failures propagate as exceptions. The
+            body is bytes, except for successful ``stream`` requests where it is
+            an unread file-like response the caller must close.
+        """
+        if self._session_config != (self.base_url, self.http2, self.keep_alive):
+            # Closed, or reconfigured since the transport was built
+            self.close()
+            self._open_session()
+        session = self._session
+
+        if self.http2:
+            req = session.build_request(
+                method, url, content=data, headers=headers, timeout=self.timeout
+            )
+            resp = session.send(req, stream=stream)
+            if stream:
+                if resp.status_code < 400:
+                    return (
+                        resp.status_code, resp.reason_phrase, resp.headers,
+                        _ByteStreamReader(resp)
+                    )
+                with resp:
+                    resp.read()
+            return resp.status_code, resp.reason_phrase, resp.headers, resp.content
+
+        if session is not None:
+            resp = session.request(
+                method, url, body=data, headers=headers,
+                timeout=self.timeout, retries=False, preload_content=not stream
+            )
+            if stream and resp.status < 400:
+                return resp.status, resp.reason or "", resp.headers, resp
+            return resp.status, resp.reason or "", resp.headers, resp.data
+
+        req = urllib.request.Request(url, data=data, headers=headers, method=method)
+        try:
+            # urlopen raises HTTPError for anything other than a 2xx response
+            resp = urllib.request.urlopen(req, timeout=self.timeout)
+            encoding = resp.headers.get("Content-Encoding")
+            if stream:
+                if encoding == "gzip":
+                    return 200, "OK", resp.headers, _GzipResponse(resp)
+                if encoding == "deflate":
+                    with resp:
+                        return 200, "OK", resp.headers, io.BytesIO(
+                            _decompress(resp.read(), encoding)
+                        )
+                return 200, "OK", resp.headers, resp
+            with resp:
+                length = resp.headers.get("Content-Length")
+                if (
+                    orjson is not None  # stdlib json can't parse a memoryview
+                    and method != "HEAD"
+                    and encoding is None
+                    and length is not None
+                    and int(length) <= _RECV_BUF_MAX
+                ):
+                    # Parsed immediately by _make_request, before the buffer is reused
+                    return 200, "OK", resp.headers, _read_into_buffer(resp, int(length))
+                return 200, "OK", resp.headers, _decompress(resp.read(), encoding)
+        except urllib.error.HTTPError as e:
+            body = b""
+            try:
+                body = _decompress(e.read(), e.headers.get("Content-Encoding"))
+            except Exception:
+                pass
+            return e.code, str(e.reason), e.headers, body
 
     def _make_request(
         self,
         url: str,
         data: Optional[bytes] = None,
-        method: str = "GET"
-    ) -> dict[str, Any]:
+        method: str = "GET",
+        stream: bool = False,
+        idempotent: bool = True,
+        extra_headers: Optional[Mapping[str, str]] = None,
+        with_headers: bool = False
+    ) -> Any:
         """Make an HTTP request with retry logic and error handling.
 
         Args:
             url: The full URL to request
             data: Optional request body (JSON-encoded bytes)
             method: HTTP method (GET or POST)
+            stream: Return the unread response instead of parsing it
+            idempotent: Whether the request is safe to repeat. Non-idempotent
+                requests are not retried after timing out waiting for a response,
+                since the tool may already have run.
+            extra_headers: Additional request headers
+            with_headers: Also return the response headers
 
         Returns:
-            The JSON response as a dictionary
+            The decoded JSON response, or with ``stream`` a file-like response
+            that the caller must close. A 304 response yields `_NOT_MODIFIED`.
+            With ``with_headers``, a ``(headers, response)`` tuple.
 
         Raises:
             RuntimeError: If the request fails after all retries or returns an error
         """
-        headers = {"Content-Type": "application/json"} if data else {}
-        delay = self.retry_delay
+        headers = _JSON_HEADERS if data else _GET_HEADERS
+        if extra_headers:
+            headers = {**headers, **extra_headers}
         last_error: Exception | None = None
+        # Bound once as locals: the loop below is the client's hot path.
+        send = self._send
+        loads = _loads
+        sleep = time.sleep
+        max_retries = self.max_retries
 
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(max_retries + 1):
             try:
-                req = urllib.request.Request(url, data=data, headers=headers, method=method)
-                with urllib.request.urlopen(req, timeout=self.timeout) as resp:
-                    return json.loads(resp.read().decode('utf-8'))
-
-            except urllib.error.HTTPError as e:
-                # Extract error details from response body
-                body = ""
-                try:
-                    body = e.read().decode('utf-8')
-                except Exception:
-                    pass
-
-                if body:
-                    try:
-                        detail = json.loads(body)
-                        msg = detail.get("error") or body
-                    except Exception:
-                        msg = body
-                else:
-                    msg = e.reason
-
-                # Don't retry 4xx errors (client errors)
-                if 400 <= e.code < 500:
-                    raise RuntimeError(f"Gateway HTTP {e.code}: {msg}") from e
-
-                last_error = RuntimeError(f"Gateway HTTP {e.code}: {msg}")
-
-            except (urllib.error.URLError, OSError, TimeoutError) as e:
+                status, reason, resp_headers, raw = send(
+                    url, data, method, headers, stream
+                )
+            except _NETWORK_ERRORS as e:
+                if not idempotent and isinstance(e, _READ_TIMEOUT_ERRORS):
+                    raise RuntimeError(
+                        f"Network error: {e} (not retried, request may have been processed)"
+                    ) from e
                 # Network errors - retry these
                 last_error = RuntimeError(f"Network error: {e}")
+                # Keep the transport error reachable, as for a raised exception
+                last_error.__cause__ = e
+            else:
+                if status < 400:
+                    if status == 304:
+                        result = _NOT_MODIFIED
+                    else:
+                        result = raw if stream else loads(raw)
+                    return (resp_headers, result) if with_headers else result
+
+                # Don't retry 4xx errors (client errors)
+                last_error = _http_error(status, reason, raw)
+                if 400 <= status < 500:
+                    raise last_error
 
             # If this wasn't the last attempt, wait before retrying
-            if attempt < self.max_retries:
-                time.sleep(delay)
-                delay *= self.retry_backoff
+            if attempt < max_retries:
+                sleep(_backoff(
+                    self.retry_delay, self.retry_backoff, self.retry_cap, attempt
+                ))
 
         # All retries exhausted
         raise RuntimeError(
-            f"Request failed after {self.max_retries + 1} attempts"
+            f"Request failed after {max_retries + 1} attempts"
         ) from last_error
 
+    def _get_cached(self, url: str) -> Any:
+        """GET a rarely-changing resource, revalidating any cached copy by ETag."""
+        cached = self._schema_cache.get(url)
+        extra_headers = {"If-None-Match": cached[0]} if cached else None
+
+        headers, result = self._make_request(
+            url, extra_headers=extra_headers, with_headers=True
+        )
+        if result is _NOT_MODIFIED:
+            if cached is None:
+                raise RuntimeError(f"Gateway returned 304 for uncached {url}")
+            return cached[1]
+
+        etag = headers.get("ETag")
+        if etag:
+            self._schema_cache[url] = (etag, result)
+        return result
+
     def get_tools(
         self,
         provider: Provider,
@@ -183,6 +642,11 @@ class GatewayClient:
         Raises:
             RuntimeError: If the request fails or the server returns an error
 
+        Note:
+            Responses are cached per URL and revalidated with ``If-None-Match``,
+            so unchanged schemas cost only a 304 round trip. The same dictionary
+            is returned while the schema is unchanged; copy it before mutating.
+
         Example:
             >>> client = GatewayClient("http://localhost:8787")
             >>>
@@ -194,11 +658,9 @@ class GatewayClient:
             >>> openai_tools = client.get_tools("openai")
             >>> print(openai_tools["tools"][0]["function"]["name"])
         """
-        url = f"{self.base_url}/tools/{provider}"
-        if server:
-            url += f"?server={server}"
-
-        return self._make_request(url)
+        return self._get_cached(
+            _url(f"{self.base_url}/tools/{provider}", server=server)
+        )
 
     def execute(
         self,
@@ -245,13 +707,13 @@ class GatewayClient:
         url = f"{self.base_url}/execute"
         payload = {
             "provider": provider,
-            "call": call,
+            "call": _decode_arguments(call) if provider != "gemini" else call,
         }
         if server:
             payload["server"] = server
 
-        data = json.dumps(payload).encode('utf-8')
-        response = self._make_request(url, data=data, method="POST")
+        data = _dumps(payload)
+        response = self._make_request(url, data=data, method="POST", idempotent=False)
 
         # Check for errors in response
         if 'error' in response:
@@ -259,6 +721,130 @@ class GatewayClient:
 
         return response.get('result')
 
+    def execute_many(
+        self,
+        provider: Provider,
+        calls: Sequence[Mapping[str, Any]],
+        server: Optional[str] = None,
+        return_exceptions: bool = False,
+        max_workers: int = 8
+    ) -> list[Any]:
+        """Execute several tool calls in a single round trip.
+
+        Sends all calls to the gateway's `/execute_batch` endpoint, which runs
+        them concurrently. Against an older gateway without that endpoint, the
+        calls are instead sent as concurrent `execute()` requests from a thread
+        pool sharing this client's connections.
+
+        Args:
+            provider: The AI provider format ("gemini", "openai", or "xai")
+            calls: Tool calls in provider-specific format (see `execute()`)
+            server: Optional server name (defaults to "default" on gateway)
+            return_exceptions: Return failed calls as RuntimeError instances in
+                the result list instead of raising the first failure
+            max_workers: Maximum concurrent requests when falling back to
+                per-call requests (default: 8)
+
+        Returns:
+            The execution results, in the same order as `calls`
+
+        Raises:
+            RuntimeError: If the request fails, or any call fails and
+                `return_exceptions` is False
+
+        Example:
+            >>> message = response.choices[0].message
+            >>> results = client.execute_many("openai", [
+            ...     {"name": tc.function.name, "arguments": tc.function.arguments}
+            ...     for tc in message.tool_calls
+            ... ])
+        """
+        if not calls:
+            return []
+
+        results: list[Any] = []
+        # The gateway caps the calls per batch, so send larger lists in chunks
+        for start in range(0, len(calls), _MAX_BATCH_CALLS):
+            if not self._batch_supported:
+                break
+            payload = {
+                "provider": provider,
+                "calls": [
+                    _decode_arguments(call) if provider != "gemini" else call
+                    for call in calls[start:start + _MAX_BATCH_CALLS]
+                ],
+            }
+            if server:
+                payload["server"] = server
+
+            try:
+                response = self._make_request(
+                    f"{self.base_url}/execute_batch", data=_dumps(payload), method="POST",
+                    idempotent=False
+                )
+            except _HTTPStatusError as e:
+                if e.status != 404:
+                    raise
+                # Gateway predates /execute_batch; don't ask again
+                self._batch_supported = False
+            else:
+                for entry in response["results"]:
+                    if "error" in entry:
+                        results.append(RuntimeError(entry["error"]))
+                    else:
+                        results.append(entry.get("result"))
+
+        if not self._batch_supported:
+            results += self.map_execute(
+                provider, calls[len(results):], server,
+                max_workers=max_workers, return_exceptions=True
+            )
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return results
+
+    def map_execute(
+        self,
+        provider: Provider,
+        calls: Sequence[Mapping[str, Any]],
+        server: Optional[str] = None,
+        max_workers: int = 8,
+        return_exceptions: bool = False
+    ) -> list[Any]:
+        """Execute several tool calls concurrently from a thread pool.
+
+        Each call is a separate `execute()` request, but the requests are in
+        flight at the same time and share this client's keep-alive connection
+        pool, so total latency approaches that of the slowest call. Prefer
+        `execute_many()`, which needs only one request on current gateways.
+
+        Args:
+            provider: The AI provider format ("gemini", "openai", or "xai")
+            calls: Tool calls in provider-specific format (see `execute()`)
+            server: Optional server name (defaults to "default" on gateway)
+            max_workers: Maximum concurrent requests (default: 8)
+            return_exceptions: Return failed calls as exceptions in the result
+                list instead of raising the first failure
+
+        Returns:
+            The execution results, in the same order as `calls`
+
+        Raises:
+            RuntimeError: If any call fails and `return_exceptions` is False
+        """
+        if not calls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+            futures = [pool.submit(self.execute, provider, call, server) for call in calls]
+
+        if not return_exceptions:
+            return [future.result() for future in futures]
+        return [future.exception() or future.result() for future in futures]
+
     def call_tool(
         self,
         server: str,
@@ -297,9 +883,9 @@ class GatewayClient:
         """
         url = f"{self.base_url}/call_tool"
         payload = {"server": server, "tool": tool, "arguments": arguments}
-        data = json.dumps(payload).encode('utf-8')
+        data = _dumps(payload)
 
-        response = self._make_request(url, data=data, method="POST")
+        response = self._make_request(url, data=data, method="POST", idempotent=False)
 
         if 'error' in response:
             raise RuntimeError(response['error'])
@@ -329,11 +915,7 @@ class GatewayClient:
         Note:
             For provider-specific formats, use `get_tools(provider)` instead.
         """
-        url = f"{self.base_url}/tools"
-        if server:
-            url += f"?server={server}"
-
-        return self._make_request(url)
+        return self._get_cached(_url(f"{self.base_url}/tools", server=server))
 
     def logs(
         self,
@@ -368,14 +950,54 @@ class GatewayClient:
             >>> for entry in logs:
             ...     print(f"{entry['timestamp']}: {entry['tool']} - {entry['result']}")
         """
-        from urllib.parse import urlencode
+        return self._make_request(
+            _url(f"{self.base_url}/logs", server=server, since=since, limit=limit)
+        )
 
-        qs = {"server": server, "limit": limit}
-        if since:
-            qs["since"] = since
+    def iter_logs(
+        self,
+        server: str,
+        since: Optional[str] = None,
+        limit: int = 100
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over execution logs without buffering the whole response.
 
-        url = f"{self.base_url}/logs?{urlencode(qs)}"
-        return self._make_request(url)
+        Like `logs()`, but when the optional `ijson` package is installed the
+        response is parsed incrementally, so only one log entry is held in
+        memory at a time. Useful for large `limit` values when filtering or
+        aggregating entries. Without `ijson` this falls back to `logs()`.
+
+        Args:
+            server: The MCP server name
+            since: Optional ISO 8601 timestamp to filter logs after this time
+            limit: Maximum number of log entries to return (default: 100)
+
+        Yields:
+            Log entries in the same format as `logs()`
+
+        Raises:
+            RuntimeError: If the request fails
+
+        Example:
+            >>> client = GatewayClient("http://localhost:8787")
+            >>> errors = sum(1 for e in client.iter_logs("default", limit=100000) if "error" in e)
+        """
+        if ijson is None:
+            yield from self.logs(server, since=since, limit=limit)
+            return
+
+        url = _url(f"{self.base_url}/logs", server=server, since=since, limit=limit)
+        resp = self._make_request(url, stream=True)
+        try:
+            yield from ijson.items(resp, "item", use_float=True)
+        finally:
+            if hasattr(resp, "release_conn"):
+                # urllib3: closing would discard the keep-alive connection, so
+                # read any rest of the body and hand the connection back
+                resp.drain_conn()
+                resp.release_conn()
+            else:
+                resp.close()
 
     def health(self) -> dict[str, Any]:
         """Check the health status of the gateway service.
@@ -395,8 +1017,279 @@ class GatewayClient:
             ...     print("Gateway is healthy")
             >>> print(f"Servers: {status.get('servers', [])}")
         """
-        url = f"{self.base_url}/health"
-        return self._make_request(url)
+        return self._make_request(f"{self.base_url}/health")
+
+    def is_healthy(self, ttl: float = 5.0) -> bool:
+        """Cheaply check whether the gateway is up.
+
+        Sends a single `HEAD /health` request (no body to transfer or parse, no
+        retries) and caches the answer for `ttl` seconds, so frequent polling
+        by supervisors costs at most one request per interval. Use `health()`
+        for the full status payload.
+
+        Args:
+            ttl: Seconds to reuse the previous answer (default: 5.0)
+
+        Returns:
+            True if the gateway answered with a 2xx status; False on any other
+            status, a network error or a malformed response
+
+        Example:
+            >>> client = GatewayClient("http://localhost:8787")
+            >>> if not client.is_healthy():
+            ...     restart_gateway()
+        """
+        now = time.monotonic()
+        if now - self._health_checked_at < ttl:
+            return self._healthy
+
+        try:
+            status, _, _, _ = self._send(
+                f"{self.base_url}/health", None, "HEAD", _GET_HEADERS
+            )
+            healthy = 200 <= status < 300
+        except (*_NETWORK_ERRORS, http.client.HTTPException):
+            # Includes garbled responses (e.g. BadStatusLine): still not healthy
+            healthy = False
+
+        self._healthy = healthy
+        self._health_checked_at = now
+        return healthy
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class AsyncGatewayClient:
+    """Asyncio client for the MCP Tool Gateway HTTP API.
+
+    Mirrors `GatewayClient`, but every method is a coroutine so independent
+    calls can run concurrently (e.g. with `asyncio.gather`) over one shared
+    keep-alive connection pool. Requires the optional `httpx` dependency.
+
+    Attributes:
+        base_url: The base URL of the gateway service (e.g., "http://localhost:8787")
+        timeout: Request timeout in seconds (default: 60.0)
+        max_retries: Maximum number of retry attempts for failed requests (default: 3)
+        retry_delay: Initial delay between retries in seconds (default: 1.0)
+        retry_backoff: Exponential backoff multiplier for retries (default: 2.0)
+        retry_cap: Upper bound on the delay between retries in seconds (default: 30.0)
+        http2: Negotiate HTTP/2 when the `h2` package is installed (default: True)
+
+    Example:
+        >>> async with AsyncGatewayClient("http://localhost:8787") as client:
+        ...     results = await asyncio.gather(*[
+        ...         client.execute("openai", {
+        ...             "name": tc.function.name,
+        ...             "arguments": tc.function.arguments
+        ...         })
+        ...         for tc in message.tool_calls
+        ...     ])
+    """
+
+    base_url: str
+    timeout: float = 60.0
+    max_retries: int = 3
+    retry_delay: float = 1.0
+    retry_backoff: float = 2.0
+    retry_cap: float = 30.0
+    http2: bool = True
+    _client: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if httpx is None:
+            raise ImportError(
+                "AsyncGatewayClient requires httpx: pip install mcp-tool-gateway[async]"
+            )
+
+    async def __aenter__(self) -> AsyncGatewayClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> Any:
+        """Return the shared `httpx.AsyncClient`, creating it on first use."""
+        if self._client is None:
+            http2 = self.http2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    http2 = False
+            # A custom transport turns off httpx's own environment proxy
+            # lookup, so pass the proxy explicitly
+            proxy = _proxy_for(self.base_url)
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=http2,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                    socket_options=_SOCKET_OPTIONS,
+                    proxy=httpx.Proxy(proxy) if proxy else None,
+                ),
+                timeout=self.timeout,
+            )
+        return self._client
+
+    async def _make_request(
+        self,
+        path: str,
+        data: Optional[bytes] = None,
+        method: str = "GET",
+        params: Optional[Mapping[str, Any]] = None,
+        idempotent: bool = True
+    ) -> Any:
+        """Make an HTTP request with retry logic and error handling.
+
+        Args:
+            path: The request path, relative to `base_url`
+            data: Optional request body (JSON-encoded bytes)
+            method: HTTP method (GET or POST)
+            params: Optional query string parameters
+            idempotent: Whether the request is safe to repeat after a read timeout
+
+        Returns:
+            The decoded JSON response
+
+        Raises:
+            RuntimeError: If the request fails after all retries or returns an error
+        """
+        client = self._get_client()
+        headers = _JSON_HEADERS if data else _GET_HEADERS
+        last_error: Exception | None = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                resp = await client.request(
+                    method, path, content=data, headers=headers, params=params
+                )
+            except (httpx.TransportError, OSError) as e:
+                if not idempotent and isinstance(e, httpx.ReadTimeout):
+                    raise RuntimeError(
+                        f"Network error: {e} (not retried, request may have been processed)"
+                    ) from e
+                # Network errors - retry these
+                last_error = RuntimeError(f"Network error: {e}")
+                # Keep the transport error reachable, as for a raised exception
+                last_error.__cause__ = e
+            else:
+                if resp.status_code < 400:
+                    return _loads(resp.content)
+
+                # Don't retry 4xx errors (client errors)
+                last_error = _http_error(resp.status_code, resp.reason_phrase, resp.content)
+                if 400 <= resp.status_code < 500:
+                    raise last_error
+
+            # If this wasn't the last attempt, wait before retrying
+            if attempt < self.max_retries:
+                await asyncio.sleep(_backoff(
+                    self.retry_delay, self.retry_backoff, self.retry_cap, attempt
+                ))
+
+        # All retries exhausted
+        raise RuntimeError(
+            f"Request failed after {self.max_retries + 1} attempts"
+        ) from last_error
+
+    async def get_tools(
+        self,
+        provider: Provider,
+        server: Optional[str] = None
+    ) -> ToolSchema:
+        """Get tools from an MCP server in provider-specific format.
+
+        See `GatewayClient.get_tools`.
+        """
+        params = {"server": server} if server else None
+        return await self._make_request(f"/tools/{provider}", params=params)
+
+    async def execute(
+        self,
+        provider: Provider,
+        call: Mapping[str, Any],
+        server: Optional[str] = None
+    ) -> ExecutionResult:
+        """Execute a tool call via the gateway using provider-specific format.
+
+        See `GatewayClient.execute`.
+        """
+        payload = {
+            "provider": provider,
+            "call": _decode_arguments(call) if provider != "gemini" else call,
+        }
+        if server:
+            payload["server"] = server
+
+        data = _dumps(payload)
+        response = await self._make_request("/execute", data=data, method="POST", idempotent=False)
+
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+
+        return response.get('result')
+
+    async def call_tool(
+        self,
+        server: str,
+        tool: str,
+        arguments: Mapping[str, Any]
+    ) -> Any:
+        """Execute a tool using the legacy generic format.
+
+        See `GatewayClient.call_tool`.
+        """
+        payload = {"server": server, "tool": tool, "arguments": arguments}
+        data = _dumps(payload)
+
+        response = await self._make_request("/call_tool", data=data, method="POST", idempotent=False)
+
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+
+        return response.get('result')
+
+    async def tools(self, server: Optional[str] = None) -> dict[str, Any]:
+        """Get raw MCP tool schemas (not provider-specific).
+
+        See `GatewayClient.tools`.
+        """
+        params = {"server": server} if server else None
+        return await self._make_request("/tools", params=params)
+
+    async def logs(
+        self,
+        server: str,
+        since: Optional[str] = None,
+        limit: int = 100
+    ) -> list[dict[str, Any]]:
+        """Retrieve execution logs from the gateway.
+
+        See `GatewayClient.logs`.
+        """
+        params: dict[str, Any] = {"server": server, "limit": limit}
+        if since:
+            params["since"] = since
+
+        return await self._make_request("/logs", params=params)
+
+    async def health(self) -> dict[str, Any]:
+        """Check the health status of the gateway service.
+
+        See `GatewayClient.health`.
+        """
+        return await self._make_request("/health")
 
 
-__all__ = ["GatewayClient", "Provider", "ToolSchema", "ExecutionResult"]
+__all__ = [
+    "GatewayClient",
+    "AsyncGatewayClient",
+    "Provider",
+    "ToolSchema",
+    "ExecutionResult",
+]
@@ -31,9 +31,22 @@ setup(
         # No external dependencies - uses only stdlib
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.0",
+        ],
+        "stream": [
+            "ijson>=3.1",
+        ],
+        "pool": [
+            "urllib3>=1.26",
+        ],
+        "async": [
+            "httpx[http2]>=0.25",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
         ],
     },
 )
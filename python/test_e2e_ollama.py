@@ -20,34 +20,240 @@ Environment Variables:
 - OLLAMA_HOST: Override default http://127.0.0.1:11434
 - OLLAMA_E2E_MODEL: Override default model (qwen3:8b)
 - GATEWAY_URL: Override default http://localhost:8787
+- E2E_DISABLE_CACHE: Set to 1 to bypass the on-disk chat response cache
+- OLLAMA_KEEP_ALIVE: How long Ollama keeps the model loaded between calls (default 10m)
+- E2E_VERBOSE: Set to 1 to pretty-print model responses and tool results
 
 Usage:
     python3 test_e2e_ollama.py
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import hashlib
 import os
+import shelve
 import sys
-import json
-import subprocess
 import time
-import signal
-from typing import Optional, Dict, Any, List
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Dict, Any, List, Sequence, Tuple
 from pathlib import Path
 
-# Check for ollama package
 try:
-    from ollama import Client as OllamaClient
+    import orjson
 except ImportError:
-    print("ERROR: ollama package not found. Install with: pip install ollama")
-    sys.exit(1)
+    orjson = None
+
+# ollama and the gateway client are imported in setup(), so the heavy
+# ollama/httpx/pydantic import only happens when the test actually runs
+if TYPE_CHECKING:
+    from ollama import AsyncClient as OllamaClient, Message
+    from mcp_tool_gateway import AsyncGatewayClient
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
+
+# Chat responses are cached on disk, keyed by model, messages and tools, so
+# repeated runs don't have to wait for the model again
+CHAT_CACHE_PATH = Path.home() / '.cache' / 'mcp_gateway_e2e' / 'ollama_chat.db'
+
+# Keep the model resident between chat calls and retain the whole context, so
+# the tool-result follow-up reuses the prompt prefix instead of re-prefilling it
+CHAT_KEEP_ALIVE = os.environ.get('OLLAMA_KEEP_ALIVE', '10m')
+CHAT_OPTIONS = {'num_keep': -1}
+
+# Pretty-print full responses and results; otherwise log short summaries
+VERBOSE = os.environ.get('E2E_VERBOSE') == '1'
+
+# Recent log entries fetched to verify the add call was logged
+LOGS_LIMIT = 10
+
+# Minimum seconds between model pull progress lines
+PULL_PROGRESS_INTERVAL = 0.2
+
+
+def _num(value: Any) -> Any:
+    """Coerce a numeric argument the model returned as a string."""
+    return float(value) if isinstance(value, str) else value
+
+
+def _get(obj: Any, key: str) -> Any:
+    """Read `key` from a dict or an attribute of a response object."""
+    return obj.get(key) if isinstance(obj, dict) else getattr(obj, key, None)
+
+
+def _model_name(model: Any) -> Optional[str]:
+    """Return the name of a listed model; newer clients call it ``model``."""
+    return _get(model, 'model') or _get(model, 'name')
+
+
+def _find_call(tool_calls: List[Any], name: str) -> Any:
+    """Return the first tool call of function `name`, or None."""
+    for call in tool_calls:
+        if call['function']['name'] == name:
+            return call
+    return None
+
+
+def _text_content(content: List[Dict[str, Any]]) -> Optional[str]:
+    """Return the text of the first text item in MCP result content, or None."""
+    for item in content:
+        if item.get('type') == 'text':
+            return item['text']
+    return None
 
-# Import our gateway client
-try:
-    from mcp_tool_gateway import GatewayClient
-except ImportError:
-    # Try to add parent directory to path
-    sys.path.insert(0, str(Path(__file__).parent))
-    from mcp_tool_gateway import GatewayClient
+
+def _caused_by(error: Optional[BaseException], types: Tuple[type, ...]) -> bool:
+    """Whether `error`, or an exception it was raised from, is one of `types`."""
+    while error is not None:
+        if isinstance(error, types):
+            return True
+        error = error.__cause__
+    return False
+
+
+async def _wait_for(
+    fn: Callable[[], Awaitable[Any]],
+    retry_on: Tuple[type, ...],
+    deadline_s: float = 5.0,
+    initial: float = 0.05
+) -> Any:
+    """Await `fn()` until it succeeds, backing off exponentially between tries.
+
+    Only errors caused by one of `retry_on` (a refused connection while a
+    service starts, say) are retried; anything else is raised at once, as is
+    the last error once the next attempt would start after `deadline_s` seconds.
+    """
+    deadline = time.monotonic() + deadline_s
+    delay = initial
+    while True:
+        try:
+            return await fn()
+        except Exception as e:
+            if not _caused_by(e, retry_on) or time.monotonic() + delay > deadline:
+                raise
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+
+def _parse_result(execution_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode the JSON payload of a tool result's first text content item.
+
+    The content list may sit under ``result`` or at the top level of the
+    execution result; without any text content the result is returned as-is.
+    """
+    result = execution_result.get('result') or {}
+    for container in (result, execution_result):
+        content = container.get('content')
+        if isinstance(content, list):
+            text_content = _text_content(content)
+            return _loads(text_content) if text_content else container
+    return result or execution_result
+
+
+def _to_jsonable(value: Any) -> Any:
+    """Convert ollama's pydantic models to plain JSON-compatible data."""
+    if hasattr(value, 'model_dump'):
+        return value.model_dump(exclude_none=True)
+    if isinstance(value, list):
+        return [_to_jsonable(item) for item in value]
+    return value
+
+
+@functools.cache
+def _to_ollama_tools(declarations_json: str) -> Tuple[Dict[str, Any], ...]:
+    """Convert Gemini function declarations, as canonical JSON, to Ollama tools.
+
+    Keyed on the serialized declarations so identical tool sets are converted
+    once. The result is shared between callers and must not be mutated.
+    """
+    return tuple(
+        {
+            'type': 'function',
+            'function': {
+                'name': tool['name'],
+                'description': tool['description'],
+                'parameters': tool['parameters']
+            }
+        }
+        for tool in _loads(declarations_json)
+    )
+
+
+def _chat_cache_key(model: str, messages: List[Any], tools: Sequence[Dict[str, Any]]) -> str:
+    """Hash a chat request into a stable cache key."""
+    payload = json.dumps([model, _to_jsonable(messages), tools], sort_keys=True)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class ToolCase:
+    """A tool-calling scenario: prompt the model, execute its call, check it."""
+
+    name: str
+    title: str
+    prompt: str
+    expected_tool: str
+    # Adjusts the model's arguments before they are sent to the gateway
+    arg_coerce: Callable[[Dict[str, Any]], Dict[str, Any]]
+    # Asserts on the parsed tool result
+    validate: Callable[[Dict[str, Any]], None]
+    # Fail, rather than warn, when the model doesn't call the tool
+    required: bool = True
+    # Text the model's follow-up reply must contain; None skips the follow-up
+    expected_reply: Optional[str] = None
+
+
+def _num_args(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Coerce numeric arguments (Ollama sometimes returns strings)."""
+    return {k: _num(v) for k, v in args.items()}
+
+
+def _check_sum(result: Dict[str, Any]) -> None:
+    assert result.get('result') == 42, f"Expected 42, got {result.get('result')}"
+    log_success("Result verified: 15 + 27 = 42")
+
+
+def _check_weather(result: Dict[str, Any]) -> None:
+    for key in ('location', 'temperature', 'conditions'):
+        assert key in result, f"{key} not in result"
+
+
+TOOL_CASES = (
+    ToolCase(
+        name="Math operation",
+        title="Test 1: Math Operation (add tool)",
+        prompt="What is 15 plus 27? Use the add tool to calculate it. You must call the add function with arguments a=15 and b=27.",
+        expected_tool='add',
+        arg_coerce=_num_args,
+        validate=_check_sum,
+        expected_reply='42',
+    ),
+    ToolCase(
+        name="Weather tool",
+        title="Test 2: Weather Tool (String Parameters)",
+        prompt="What's the weather in San Francisco? Use the get_weather tool with location 'San Francisco'.",
+        expected_tool='get_weather',
+        arg_coerce=dict,
+        validate=_check_weather,
+        # Smaller models don't always call the tool for this prompt
+        required=False,
+    ),
+)
 
 
 class Colors:
@@ -62,31 +268,62 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# No color codes when output is piped or captured (e.g. CI logs)
+if not sys.stdout.isatty():
+    for _name in ('HEADER', 'BLUE', 'CYAN', 'GREEN', 'YELLOW', 'RED', 'END', 'BOLD'):
+        setattr(Colors, _name, '')
+    del _name
+
+# Log prefixes, built once
+_SECTION_BAR = f"{Colors.BOLD}{Colors.CYAN}{'=' * 60}{Colors.END}\n"
+_SECTION_TITLE = f"{Colors.BOLD}{Colors.CYAN}"
+_INFO = f"{Colors.BLUE}[INFO]{Colors.END} "
+_SUCCESS = f"{Colors.GREEN}[SUCCESS]{Colors.END} "
+_ERROR = f"{Colors.RED}[ERROR]{Colors.END} "
+_WARNING = f"{Colors.YELLOW}[WARNING]{Colors.END} "
+
+
+# Output of the running test case, while cases run concurrently; None writes
+# straight to stdout
+_log_buffer: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    '_log_buffer', default=None
+)
+
+
+def _write(text: str) -> None:
+    """Write to stdout, or to the current test case's buffer."""
+    buffer = _log_buffer.get()
+    if buffer is None:
+        sys.stdout.write(text)
+    else:
+        buffer.append(text)
+
+
 def log_section(message: str) -> None:
     """Print a section header."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 60}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{message}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'=' * 60}{Colors.END}\n")
+    _write(
+        "\n" + _SECTION_BAR + _SECTION_TITLE + message + Colors.END + "\n" + _SECTION_BAR + "\n"
+    )
 
 
 def log_info(message: str) -> None:
     """Print an info message."""
-    print(f"{Colors.BLUE}[INFO]{Colors.END} {message}")
+    _write(_INFO + message + "\n")
 
 
 def log_success(message: str) -> None:
     """Print a success message."""
-    print(f"{Colors.GREEN}[SUCCESS]{Colors.END} {message}")
+    _write(_SUCCESS + message + "\n")
 
 
 def log_error(message: str) -> None:
     """Print an error message."""
-    print(f"{Colors.RED}[ERROR]{Colors.END} {message}")
+    _write(_ERROR + message + "\n")
 
 
 def log_warning(message: str) -> None:
     """Print a warning message."""
-    print(f"{Colors.YELLOW}[WARNING]{Colors.END} {message}")
+    _write(_WARNING + message + "\n")
 
 
 class OllamaE2ETest:
@@ -96,65 +333,156 @@ class OllamaE2ETest:
         self.ollama_host = os.environ.get('OLLAMA_HOST', 'http://127.0.0.1:11434')
         self.model = os.environ.get('OLLAMA_E2E_MODEL', 'qwen3:8b')
         self.gateway_url = os.environ.get('GATEWAY_URL', 'http://localhost:8787')
-        self.gateway_process: Optional[subprocess.Popen] = None
         self.ollama_client: Optional[OllamaClient] = None
-        self.gateway_client: Optional[GatewayClient] = None
+        self.gateway_client: Optional[AsyncGatewayClient] = None
+        self.function_declarations: List[Dict[str, Any]] = []
+        self.ollama_tools: Tuple[Dict[str, Any], ...] = ()
+        self.chat_cache: Optional[shelve.Shelf] = None
+        self.warm_up_task: Optional[asyncio.Task] = None
 
-    def setup(self) -> None:
+    async def setup(self) -> None:
         """Set up test prerequisites."""
         log_section("Setting Up E2E Test Environment")
 
-        # Check if Ollama is accessible
-        log_info(f"Checking Ollama at {self.ollama_host}")
-        self.ollama_client = OllamaClient(host=self.ollama_host)
-
+        # Check for ollama package (httpx is one of its dependencies)
         try:
-            self.ollama_client.list()
-            log_success(f"Ollama is accessible at {self.ollama_host}")
-        except Exception as e:
-            log_error(f"Cannot connect to Ollama: {e}")
-            log_info("Make sure Ollama is running: ollama serve")
+            import httpx
+            from ollama import AsyncClient as OllamaClient
+        except ImportError:
+            log_error("ollama package not found. Install with: pip install ollama")
             raise
 
-        # Ensure model is available
-        self._ensure_model()
+        # Import our gateway client
+        try:
+            from mcp_tool_gateway import AsyncGatewayClient
+        except ImportError:
+            # Try to add parent directory to path
+            sys.path.insert(0, str(Path(__file__).parent))
+            from mcp_tool_gateway import AsyncGatewayClient
+
+        if os.environ.get('E2E_DISABLE_CACHE') != '1':
+            CHAT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            self.chat_cache = shelve.open(str(CHAT_CACHE_PATH))
+            log_info(f"Caching chat responses in {CHAT_CACHE_PATH} (E2E_DISABLE_CACHE=1 to bypass)")
+
+        # Keep connections to Ollama open across the run's chat calls. The
+        # gateway client pools its own connections; the two talk to different
+        # hosts, so there is nothing to gain from sharing one pool.
+        self.ollama_client = OllamaClient(
+            host=self.ollama_host,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60)
+        )
+        self.gateway_client = AsyncGatewayClient(self.gateway_url, timeout=30)
+
+        # Check that Ollama and the gateway are accessible, concurrently,
+        # retrying network errors briefly in case either is still starting up.
+        # The gateway is probed with a client of its own that does not retry,
+        # so _wait_for's short backoff alone decides when to try again.
+        log_info(f"Checking Ollama at {self.ollama_host} and gateway at {self.gateway_url}")
+        network_errors = (OSError, httpx.TransportError)
+        probe_client = AsyncGatewayClient(self.gateway_url, timeout=5, max_retries=0)
+        try:
+            ollama_check, gateway_check = await asyncio.gather(
+                _wait_for(self.ollama_client.list, retry_on=network_errors),
+                _wait_for(probe_client.health, retry_on=network_errors),
+                return_exceptions=True
+            )
+        finally:
+            await probe_client.aclose()
 
-        # Check if gateway is accessible
-        log_info(f"Checking gateway at {self.gateway_url}")
-        self.gateway_client = GatewayClient(self.gateway_url, timeout=30)
+        if isinstance(ollama_check, Exception):
+            log_error(f"Cannot connect to Ollama: {ollama_check}")
+            log_info("Make sure Ollama is running: ollama serve")
+        else:
+            log_success(f"Ollama is accessible at {self.ollama_host}")
 
-        try:
-            health = self.gateway_client.health()
-            log_success(f"Gateway is accessible: {health}")
-        except Exception as e:
-            log_error(f"Cannot connect to gateway: {e}")
+        if isinstance(gateway_check, Exception):
+            log_error(f"Cannot connect to gateway: {gateway_check}")
             log_info("Make sure the gateway is running or configure GATEWAY_URL")
-            raise
+        else:
+            log_success(f"Gateway is accessible: {gateway_check}")
+
+        for check in (ollama_check, gateway_check):
+            if isinstance(check, Exception):
+                raise check
+
+        # Ensure model is available, reusing the listing from the reachability check
+        await self._ensure_model(ollama_check)
 
-    def _ensure_model(self) -> None:
-        """Ensure the required model is available."""
+        # Without the cache every case calls the model, so start loading it
+        # now; with it, the first cache miss does (a fully cached run never has to)
+        if self.chat_cache is None:
+            self._ensure_warm()
+
+        # Tool schemas are static for the whole run: fetch and convert them once
+        log_info("Fetching tools from gateway...")
+        tools_response = await self.gateway_client.get_tools("gemini", server="default")
+        self.function_declarations = tools_response.get('function_declarations', [])
+        log_success(f"Retrieved {len(self.function_declarations)} tools")
+
+        self.ollama_tools = _to_ollama_tools(json.dumps(self.function_declarations, sort_keys=True))
+
+    def _ensure_warm(self) -> asyncio.Task:
+        """Start the model warm-up, once per run, and return its task."""
+        if self.warm_up_task is None:
+            self.warm_up_task = asyncio.ensure_future(self._warm_up())
+        return self.warm_up_task
+
+    async def _warm_up(self) -> None:
+        """Load the model with a one-token request so the tests don't pay for it."""
+        log_info(f"Warming up {self.model} (keep_alive={CHAT_KEEP_ALIVE})...")
+        await self.ollama_client.chat(
+            model=self.model,
+            messages=[{'role': 'user', 'content': 'ping'}],
+            keep_alive=CHAT_KEEP_ALIVE,
+            options={'num_predict': 1}
+        )
+        log_success(f"Model {self.model} is loaded")
+
+    async def _ensure_model(self, models: Any = None) -> None:
+        """Ensure the required model is available.
+
+        Args:
+            models: A response from ``list()`` to reuse instead of fetching one
+        """
         log_info(f"Checking for model: {self.model}")
 
         try:
-            models = self.ollama_client.list()
-            model_names = [m.model for m in models.models] if hasattr(models, 'models') else []
+            if models is None:
+                models = await self.ollama_client.list()
+            model_names = {_model_name(m) for m in _get(models, 'models') or ()}
+            target = self.model
+            target_latest = target if ':' in target else f"{target}:latest"
 
-            if self.model in model_names or f"{self.model}:latest" in model_names:
+            if target in model_names or target_latest in model_names:
                 log_success(f"Model {self.model} is available")
                 return
 
             log_warning(f"Model {self.model} not found locally")
             log_info(f"Pulling model {self.model} (this may take a few minutes)...")
 
-            # Pull the model with progress
-            stream = self.ollama_client.pull(self.model, stream=True)
-            last_status = None
+            # Pull the model, showing progress on a terminal at most every
+            # PULL_PROGRESS_INTERVAL seconds
+            stream = await self.ollama_client.pull(self.model, stream=True)
+            show_progress = sys.stdout.isatty()
+            last_status = shown_status = None
+            last_print_ts = 0.0
 
-            for progress in stream:
+            async for progress in stream:
+                if not show_progress:
+                    continue
                 status = progress.get('status', '')
-                if status != last_status:
-                    print(f"  {status}")
-                    last_status = status
+                now = time.monotonic()
+                if status != last_status and now - last_print_ts >= PULL_PROGRESS_INTERVAL:
+                    sys.stdout.write(f"  {status}\n")
+                    shown_status = status
+                    last_print_ts = now
+                last_status = status
+
+            if show_progress:
+                if last_status != shown_status:
+                    sys.stdout.write(f"  {last_status}\n")
+                sys.stdout.flush()
 
             log_success(f"Model {self.model} pulled successfully")
 
@@ -162,213 +490,191 @@ class OllamaE2ETest:
             log_error(f"Failed to ensure model availability: {e}")
             raise
 
-    def test_math_operation(self) -> None:
-        """Test basic math operation with tool calling."""
-        log_section("Test 1: Math Operation (add tool)")
-
-        # Step 1: Get tools in Gemini format
-        log_info("Fetching tools from gateway...")
-        tools_response = self.gateway_client.get_tools("gemini", server="default")
-
-        function_declarations = tools_response.get('function_declarations', [])
-        log_success(f"Retrieved {len(function_declarations)} tools")
-
-        tool_names = [t['name'] for t in function_declarations]
-        log_info(f"Available tools: {', '.join(tool_names)}")
-
-        assert 'add' in tool_names, "add tool not found"
-        assert 'multiply' in tool_names, "multiply tool not found"
-        assert 'get_weather' in tool_names, "get_weather tool not found"
-
-        # Step 2: Convert to Ollama format
-        log_info("Converting tools to Ollama format...")
-        ollama_tools = [
-            {
-                'type': 'function',
-                'function': {
-                    'name': tool['name'],
-                    'description': tool['description'],
-                    'parameters': tool['parameters']
-                }
-            }
-            for tool in function_declarations
-        ]
-
-        # Step 3: Call Ollama with tools
-        log_info("Calling Ollama to generate function call...")
-        prompt = "What is 15 plus 27? Use the add tool to calculate it. You must call the add function with arguments a=15 and b=27."
-
-        response = self.ollama_client.chat(
+    async def _chat_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Sequence[Dict[str, Any]],
+        new_responses: Dict[str, Any],
+        echo: bool = False
+    ) -> Message:
+        """Stream a chat completion and reassemble the assistant message.
+
+        With ``echo``, content is printed as it arrives (into the test case's
+        buffer when cases run concurrently) instead of after the model has
+        finished generating. Responses are served from the chat cache when it
+        is enabled; fresh ones are added to ``new_responses`` for the caller to
+        cache once it has checked them.
+        """
+        from ollama import Message
+
+        key = None
+        if self.chat_cache is not None:
+            key = _chat_cache_key(self.model, messages, tools)
+            cached = self.chat_cache.get(key)
+            if cached is not None:
+                message = Message(**cached)
+                if echo:
+                    _write(message.content + "\n")
+                return message
+
+        await self._ensure_warm()
+
+        content: List[str] = []
+        tool_calls: List[Any] = []
+
+        async for chunk in await self.ollama_client.chat(
             model=self.model,
-            messages=[
-                {'role': 'user', 'content': prompt}
-            ],
-            tools=ollama_tools
-        )
-
-        log_info(f"Ollama response: {response['message']}")
+            messages=messages,
+            tools=tools,
+            stream=True,
+            keep_alive=CHAT_KEEP_ALIVE,
+            options=CHAT_OPTIONS
+        ):
+            message = chunk['message']
+            if message.content:
+                content.append(message.content)
+                if echo:
+                    _write(message.content)
+                    if _log_buffer.get() is None:
+                        sys.stdout.flush()
+            if message.tool_calls:
+                tool_calls.extend(message.tool_calls)
+            if chunk.get('done'):
+                break
+
+        if echo:
+            _write("\n")
+        message = Message(role='assistant', content=''.join(content), tool_calls=tool_calls or None)
+        if key is not None:
+            new_responses[key] = _to_jsonable(message)
+        return message
+
+    async def _run_tool_case(self, case: ToolCase) -> None:
+        """Run one tool-calling scenario end to end."""
+        log_section(case.title)
+
+        # Step 1: Call Ollama with tools
+        log_info(f"Calling Ollama to generate {case.expected_tool} function call...")
+
+        # One conversation list, extended in place, so each follow-up shares
+        # the earlier turns as a prefix Ollama can reuse from its KV cache.
+        messages: List[Any] = [{'role': 'user', 'content': case.prompt}]
+        # Responses are cached only once the case passes, so a bad generation
+        # isn't replayed on every later run
+        new_responses: Dict[str, Any] = {}
+        message = await self._chat_stream(messages, self.ollama_tools, new_responses)
+
+        if VERBOSE:
+            log_info(f"Ollama response: {_dumps(_to_jsonable(message), indent=True)}")
+        else:
+            log_info(f"Ollama response: {len(message.get('tool_calls') or ())} tool_call(s)")
 
-        # Step 4: Extract function call
-        message = response['message']
-        tool_calls = message.tool_calls if hasattr(message, 'tool_calls') else []
-        assert tool_calls, "No tool calls generated by Ollama"
+        # Step 2: Extract function call
+        tool_calls = message.get('tool_calls') or []
+        tool_call = _find_call(tool_calls, case.expected_tool)
 
-        add_call = next((call for call in tool_calls if call.function.name == 'add'), None)
-        assert add_call, "add function not called"
+        if tool_call is None:
+            assert not case.required, f"{case.expected_tool} function not called"
+            log_warning(f"Model did not call {case.expected_tool} (can happen with smaller models)")
+            return
 
-        log_success(f"Ollama called: {add_call.function.name}")
-        log_info(f"Arguments: {add_call.function.arguments}")
+        function = tool_call['function']
+        log_success(f"Ollama called: {function['name']}")
+        log_info(f"Arguments: {function['arguments']}")
 
-        # Step 5: Execute via gateway
+        # Step 3: Execute via gateway
         log_info("Executing tool via gateway...")
-
-        # Convert arguments (Ollama sometimes returns strings)
-        args = add_call.function.arguments
-        converted_args = {
-            'a': float(args.get('a')) if isinstance(args.get('a'), str) else args.get('a'),
-            'b': float(args.get('b')) if isinstance(args.get('b'), str) else args.get('b')
-        }
-
-        execution_result = self.gateway_client.execute(
+        execution_result = await self.gateway_client.execute(
             provider='gemini',
-            call={'name': 'add', 'args': converted_args},
+            call={'name': function['name'], 'args': case.arg_coerce(function['arguments'])},
             server='default'
         )
 
-        log_success(f"Tool executed successfully")
-        log_info(f"Result: {json.dumps(execution_result, indent=2)}")
-
-        # Parse the result
-        result = execution_result.get('result', {})
-        if 'content' in result and isinstance(result['content'], list):
-            text_content = next((c['text'] for c in result['content'] if c.get('type') == 'text'), None)
-            parsed_result = json.loads(text_content) if text_content else result
-        elif 'content' in execution_result and isinstance(execution_result['content'], list):
-            text_content = next((c['text'] for c in execution_result['content'] if c.get('type') == 'text'), None)
-            parsed_result = json.loads(text_content) if text_content else execution_result
+        log_success("Tool executed successfully")
+        if VERBOSE:
+            log_info(f"Result: {_dumps(execution_result, indent=True)}")
         else:
-            parsed_result = result if result else execution_result
+            log_info(f"Result keys: {', '.join(execution_result)}")
 
-        assert parsed_result.get('result') == 42, f"Expected 42, got {parsed_result.get('result')}"
-        log_success(f"Result verified: 15 + 27 = 42")
+        parsed_result = _parse_result(execution_result)
+        case.validate(parsed_result)
 
-        # Step 6: Send result back to Ollama
-        log_info("Sending result back to Ollama for final response...")
+        # Step 4: Send result back to Ollama
+        if case.expected_reply is not None:
+            log_info("Sending result back to Ollama for final response...")
 
-        final_response = self.ollama_client.chat(
-            model=self.model,
-            messages=[
-                {'role': 'user', 'content': prompt},
-                response['message'],
-                {'role': 'tool', 'content': json.dumps(parsed_result)}
-            ],
-            tools=ollama_tools
-        )
+            messages.append(message)
+            # Serialized with stdlib json, not _dumps: this text is part of the
+            # prompt and the cache key, so it mustn't depend on orjson
+            messages.append({'role': 'tool', 'content': json.dumps(parsed_result)})
+            final_message = await self._chat_stream(
+                messages, self.ollama_tools, new_responses, echo=True
+            )
+
+            final_text = final_message.content
+            log_success(f"Ollama final response: {final_text}")
+
+            assert case.expected_reply in final_text.lower(), \
+                f"Final response doesn't mention {case.expected_reply}"
 
-        final_text = final_response['message']['content']
-        log_success(f"Ollama final response: {final_text}")
+        log_success(f"{case.name} test PASSED!")
+        if self.chat_cache is not None:
+            self.chat_cache.update(new_responses)
 
-        assert '42' in final_text.lower(), "Final response doesn't mention 42"
-        log_success("Math operation test PASSED!")
+    async def _run_tool_case_buffered(self, case: ToolCase, buffer: List[str]) -> None:
+        """Run a tool case, collecting its output in `buffer` instead of printing it."""
+        # Each gathered case runs in its own task, with its own copy of the context
+        _log_buffer.set(buffer)
+        await self._run_tool_case(case)
 
-    def test_logs(self) -> None:
+    async def test_logs(self) -> None:
         """Verify that tool executions are logged."""
-        log_section("Test 2: Log Verification")
+        log_section(f"Test {len(TOOL_CASES) + 1}: Log Verification")
 
         log_info("Fetching logs from gateway...")
-        logs = self.gateway_client.logs(server="default", limit=100)
+        # /logs returns the most recent entries, and the add call was just
+        # made, so a handful of rows is enough to find it
+        logs = await self.gateway_client.logs(server="default", limit=LOGS_LIMIT)
 
         log_success(f"Retrieved {len(logs)} log entries")
 
         assert len(logs) > 0, "No logs found"
 
-        tool_names = [log.get('tool') for log in logs]
+        tool_names = {log.get('tool') for log in logs}
         assert 'add' in tool_names, "add tool not found in logs"
 
-        log_info(f"Logged tools: {', '.join(set(tool_names))}")
+        log_info(f"Logged tools: {', '.join(sorted(filter(None, tool_names)))}")
         log_success("Log verification test PASSED!")
 
-    def test_weather_tool(self) -> None:
-        """Test weather tool with string parameters."""
-        log_section("Test 3: Weather Tool (String Parameters)")
-
-        # Get tools
-        log_info("Fetching tools from gateway...")
-        tools_response = self.gateway_client.get_tools("gemini", server="default")
-        function_declarations = tools_response.get('function_declarations', [])
-
-        # Convert to Ollama format
-        ollama_tools = [
-            {
-                'type': 'function',
-                'function': {
-                    'name': tool['name'],
-                    'description': tool['description'],
-                    'parameters': tool['parameters']
-                }
-            }
-            for tool in function_declarations
-        ]
-
-        # Call Ollama
-        log_info("Calling Ollama for weather query...")
-        prompt = "What's the weather in San Francisco? Use the get_weather tool with location 'San Francisco'."
-
-        response = self.ollama_client.chat(
-            model=self.model,
-            messages=[
-                {'role': 'user', 'content': prompt}
-            ],
-            tools=ollama_tools
-        )
-
-        tool_calls = response['message'].get('tool_calls', [])
-
-        if not tool_calls:
-            log_warning("Model did not generate tool calls (can happen with smaller models)")
-            return
-
-        weather_call = next((call for call in tool_calls if call['function']['name'] == 'get_weather'), None)
-
-        if not weather_call:
-            log_warning("Model did not call get_weather (can happen with smaller models)")
-            return
-
-        log_success(f"Ollama called: {weather_call['function']['name']}")
-        log_info(f"Arguments: {weather_call['function']['arguments']}")
-
-        # Execute via gateway
-        log_info("Executing weather tool via gateway...")
-        execution_result = self.gateway_client.execute(
-            provider='gemini',
-            call={'name': weather_call['function']['name'], 'args': weather_call['function']['arguments']},
-            server='default'
-        )
-
-        log_success(f"Weather tool executed successfully")
-        log_info(f"Result: {json.dumps(execution_result, indent=2)}")
-
-        # Parse result
-        result = execution_result.get('result', {})
-        if 'content' in result and isinstance(result['content'], list):
-            text_content = next((c['text'] for c in result['content'] if c.get('type') == 'text'), None)
-            parsed_result = json.loads(text_content) if text_content else result
-        else:
-            parsed_result = result
-
-        assert 'location' in parsed_result, "location not in result"
-        assert 'temperature' in parsed_result, "temperature not in result"
-        assert 'conditions' in parsed_result, "conditions not in result"
-
-        log_success("Weather tool test PASSED!")
-
-    def run(self) -> bool:
+    async def run(self) -> bool:
         """Run all tests."""
         try:
-            self.setup()
-            self.test_math_operation()
-            self.test_logs()
-            self.test_weather_tool()
+            await self.setup()
+
+            tool_names = {t['name'] for t in self.function_declarations}
+            log_info(f"Available tools: {', '.join(sorted(tool_names))}")
+            for name in ('add', 'multiply', 'get_weather'):
+                assert name in tool_names, f"{name} tool not found"
+
+            # The tool cases are independent and mostly wait on the model, so
+            # run them concurrently. Their output is buffered and printed
+            # case by case afterwards, rather than interleaved. Log
+            # verification needs the add call to have been logged, so it runs
+            # afterwards.
+            buffers: List[List[str]] = [[] for _ in TOOL_CASES]
+            results = await asyncio.gather(
+                *(
+                    self._run_tool_case_buffered(case, buffer)
+                    for case, buffer in zip(TOOL_CASES, buffers)
+                ),
+                return_exceptions=True
+            )
+            for buffer in buffers:
+                sys.stdout.write(''.join(buffer))
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            await self.test_logs()
 
             log_section("All Tests PASSED!")
             return True
@@ -382,14 +688,25 @@ class OllamaE2ETest:
             traceback.print_exc()
             return False
         finally:
-            self.cleanup()
+            await self.cleanup()
 
-    def cleanup(self) -> None:
+    async def cleanup(self) -> None:
         """Clean up resources."""
         log_info("Cleaning up...")
-        if self.gateway_process:
-            self.gateway_process.terminate()
-            self.gateway_process.wait()
+        if self.warm_up_task is not None and not self.warm_up_task.done():
+            self.warm_up_task.cancel()
+        try:
+            if self.gateway_client:
+                await self.gateway_client.aclose()
+        finally:
+            try:
+                if self.ollama_client is not None:
+                    # Older ollama releases have no close(); shut their httpx pool directly
+                    close = getattr(self.ollama_client, "close", None)
+                    await (close() if close else self.ollama_client._client.aclose())
+            finally:
+                if self.chat_cache is not None:
+                    self.chat_cache.close()
 
 
 def main():
@@ -400,7 +717,7 @@ def main():
     print(f"Gateway URL: {os.environ.get('GATEWAY_URL', 'http://localhost:8787')}")
 
     test = OllamaE2ETest()
-    success = test.run()
+    success = asyncio.run(test.run())
 
     sys.exit(0 if success else 1)
 